@@ -2,8 +2,11 @@ import datetime
 import logging
 from typing import Any, Dict, List, Optional
 
+import diskcache
+import httpx
+import numpy as np
+import orjson
 import pandas as pd
-import requests
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
@@ -12,16 +15,24 @@ logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
 class SpaceXDataExtractor:
     """Extract and process SpaceX launch data from the API.
 
-    This class fetches launch data from the SpaceX API, retrieves
-    associated details for launchpads, payloads, rockets, and cores,
-    and processes the data into a structured Pandas DataFrame.
+    This class queries launch data from the SpaceX API with the associated
+    launchpads, payloads, rockets, and cores populated in the same
+    response, and processes the data into a structured Pandas DataFrame.
     """
 
-    SPACEX_LAUNCHES_URL: str = "https://api.spacexdata.com/v4/launches/past"
-    LAUNCHPADS_URL: str = "https://api.spacexdata.com/v4/launchpads/"
-    PAYLOADS_URL: str = "https://api.spacexdata.com/v4/payloads/"
-    ROCKETS_URL: str = "https://api.spacexdata.com/v4/rockets/"
-    CORES_URL: str = "https://api.spacexdata.com/v4/cores/"
+    SPACEX_LAUNCHES_QUERY_URL: str = "https://api.spacexdata.com/v4/launches/query"
+    REQUEST_TIMEOUT: float = 10.0
+    CACHE_DIRECTORY: str = ".spacex_cache"
+    CACHE_EXPIRE_SECONDS: int = 86400
+    LAUNCH_COLUMNS: List[str] = ['rocket', 'payloads', 'launchpad', 'cores',
+                                 'flight_number', 'date_utc']
+    # Populated paths and the only fields read from each related document
+    POPULATED_FIELDS: Dict[str, List[str]] = {
+        "launchpad": ["name", "longitude", "latitude"],
+        "payloads": ["mass_kg", "orbit"],
+        "rocket": ["name"],
+        "cores.core": ["block", "reuse_count", "serial"]
+    }
 
     def __init__(self, limit_date: datetime.date = datetime.date(2020, 11, 13)) -> None:
         """
@@ -33,173 +44,222 @@ class SpaceXDataExtractor:
         """
         self.limit_date: datetime.date = limit_date
 
-        # Data containers for launch details
-        self.booster_versions: List[Optional[str]] = []
-        self.payload_masses: List[Optional[float]] = []
-        self.orbits: List[Optional[str]] = []
-        self.launch_sites: List[Optional[str]] = []
-        self.outcomes: List[Optional[str]] = []
-        self.flights: List[Optional[int]] = []
-        self.grid_fins: List[Optional[bool]] = []
-        self.reused_status: List[Optional[bool]] = []
-        self.legs: List[Optional[bool]] = []
-        self.landing_pads: List[Optional[str]] = []
-        self.block_numbers: List[Optional[int]] = []
-        self.reuse_counts: List[Optional[int]] = []
-        self.core_serials: List[Optional[str]] = []
-        self.longitudes: List[Optional[float]] = []
-        self.latitudes: List[Optional[float]] = []
+        # Data containers for launch details, sized once raw_data is known
+        self._allocate_containers(0)
 
         # Main DataFrame containers
         self.raw_data: Optional[pd.DataFrame] = None
         self.processed_data: Optional[pd.DataFrame] = None
 
-    @staticmethod
-    def fetch_json(url: str) -> Optional[Dict[str, Any]]:
+        # HTTP client kept for the extractor's lifetime to reuse connections
+        self._client: httpx.Client = httpx.Client(http2=True,
+                                                  timeout=self.REQUEST_TIMEOUT)
+
+        # On-disk cache of raw API responses, keyed by URL and query body
+        self._cache: diskcache.Cache = diskcache.Cache(self.CACHE_DIRECTORY)
+
+    def _allocate_containers(self, size: int) -> None:
+        """
+        Preallocate one object array per launch detail field.
+
+        Args:
+            size (int): Number of launches the arrays must hold.
+        """
+        self.booster_versions: np.ndarray = np.full(size, None, dtype=object)
+        self.payload_masses: np.ndarray = np.full(size, None, dtype=object)
+        self.orbits: np.ndarray = np.full(size, None, dtype=object)
+        self.launch_sites: np.ndarray = np.full(size, None, dtype=object)
+        self.outcomes: np.ndarray = np.full(size, None, dtype=object)
+        self.flights: np.ndarray = np.full(size, None, dtype=object)
+        self.grid_fins: np.ndarray = np.full(size, None, dtype=object)
+        self.reused_status: np.ndarray = np.full(size, None, dtype=object)
+        self.legs: np.ndarray = np.full(size, None, dtype=object)
+        self.landing_pads: np.ndarray = np.full(size, None, dtype=object)
+        self.block_numbers: np.ndarray = np.full(size, None, dtype=object)
+        self.reuse_counts: np.ndarray = np.full(size, None, dtype=object)
+        self.core_serials: np.ndarray = np.full(size, None, dtype=object)
+        self.longitudes: np.ndarray = np.full(size, None, dtype=object)
+        self.latitudes: np.ndarray = np.full(size, None, dtype=object)
+
+    def close(self) -> None:
+        """Close the underlying HTTP client and response cache."""
+        self._client.close()
+        self._cache.close()
+
+    def fetch_json(self, url: str, query: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """
-        Fetch JSON data from the given URL with error handling.
+        Post a query to the given URL and return the JSON response.
+
+        Raw response bodies are cached on disk for ``CACHE_EXPIRE_SECONDS``,
+        so repeated runs with the same query skip the network.
 
         Args:
-            url (str): The API URL to fetch data from.
+            url (str): The API query URL.
+            query (Dict[str, Any]): The query body to send.
 
         Returns:
             Optional[Dict[str, Any]]: The JSON response as a dictionary,
             or None if an error occurs.
         """
+        body = orjson.dumps(query, option=orjson.OPT_SORT_KEYS)
+        key = f"{url} {body.decode()}"
+        content = self._cache.get(key)
+        if content is not None:
+            logging.info("Using cached response for %s", url)
+            return orjson.loads(content)
+
         try:
-            response = requests.get(url)
+            response = self._client.post(
+                url, content=body,
+                headers={"Content-Type": "application/json"}
+            )
             response.raise_for_status()
-            return response.json()
-        except requests.RequestException as error:
+            data = orjson.loads(response.content)
+        except (httpx.HTTPError, orjson.JSONDecodeError) as error:
             logging.error("Error fetching data from %s: %s", url, error)
             return None
 
+        # Only cache query results, so an unexpected body is not replayed
+        if isinstance(data, dict) and 'docs' in data:
+            self._cache.set(key, response.content,
+                            expire=self.CACHE_EXPIRE_SECONDS)
+        return data
+
+    def build_launch_query(self) -> Dict[str, Any]:
+        """
+        Build the query body for past launches up to the limit date.
+
+        Returns:
+            Dict[str, Any]: Query selecting launches on or before
+            ``limit_date``, sorted by flight number as ``/launches/past``
+            returned them, with their related documents populated. Only
+            the fields used by the extractor are returned, since the same
+            rocket and launchpad documents are embedded in every launch.
+        """
+        limit = datetime.datetime.combine(self.limit_date, datetime.time.max)
+        return {
+            "query": {
+                "upcoming": False,
+                "date_utc": {"$lte": limit.isoformat() + "Z"}
+            },
+            "options": {
+                "select": " ".join(self.LAUNCH_COLUMNS),
+                "populate": [
+                    {"path": path, "select": " ".join(fields)}
+                    for path, fields in self.POPULATED_FIELDS.items()
+                ],
+                "sort": {"flight_number": "asc"},
+                "pagination": False
+            }
+        }
+
     def fetch_launch_data(self) -> None:
         """
         Fetch launch data from the SpaceX API and preprocess the DataFrame.
 
         The method filters columns, removes rows with multiple cores or
         payloads, extracts single values from lists, and filters data
-        based on the launch date.
+        based on the launch date. Falcon 1 launches are dropped here so
+        no details are extracted for them.
         """
-        response = self.fetch_json(self.SPACEX_LAUNCHES_URL)
-        if response is None:
+        response = self.fetch_json(self.SPACEX_LAUNCHES_QUERY_URL,
+                                   self.build_launch_query())
+        launches = response.get('docs') if isinstance(response, dict) else None
+        if launches is None:
             logging.error("Failed to retrieve launch data.")
             return
 
-        df = pd.json_normalize(response)
-        logging.info("Columns in the raw data: %s", list(df.columns))
-
-        # Keep only required columns
-        df = df[['rocket', 'payloads', 'launchpad', 'cores',
-                 'flight_number', 'date_utc']]
+        # Build only the required columns instead of normalizing every field
+        df = pd.DataFrame({
+            column: [launch.get(column) for launch in launches]
+            for column in self.LAUNCH_COLUMNS
+        })
+        logging.info("Retrieved %d launches.", len(df))
 
         # Remove rows with multiple cores or payloads
-        df = df[df['cores'].map(len) == 1]
-        df = df[df['payloads'].map(len) == 1]
+        single = np.array([len(cores) == 1 and len(payloads) == 1
+                           for cores, payloads in zip(df['cores'].to_numpy(),
+                                                      df['payloads'].to_numpy())],
+                          dtype=bool)
+        df = df.loc[single].copy()
 
         # Extract single values from lists
-        df['cores'] = df['cores'].map(lambda x: x[0])
-        df['payloads'] = df['payloads'].map(lambda x: x[0])
-
-        # Convert date_utc to datetime.date and filter based on limit_date
-        df['date'] = pd.to_datetime(df['date_utc']).dt.date
-        df = df[df['date'] <= self.limit_date]
+        df['cores'] = [cores[0] for cores in df['cores'].to_numpy()]
+        df['payloads'] = [payloads[0] for payloads in df['payloads'].to_numpy()]
+
+        # Keep launches before the day after limit_date, comparing as int64 ns
+        dates = pd.to_datetime(df['date_utc'], utc=True, format='ISO8601',
+                               cache=True)
+        day_after_limit = (pd.Timestamp(self.limit_date, tz='UTC')
+                           + pd.Timedelta(days=1))
+        df = df[dates < day_after_limit]
+
+        # Drop Falcon 1 launches before any launch details are extracted
+        is_falcon9 = np.array([(rocket or {}).get('name') != 'Falcon 1'
+                               for rocket in df['rocket'].to_numpy()],
+                              dtype=bool)
+        df = df.loc[is_falcon9]
 
         self.raw_data = df.reset_index(drop=True)
+        self._allocate_containers(len(self.raw_data))
 
     def get_launch_site_data(self) -> None:
-        """Populate launch site related fields from the API."""
+        """Populate launch site related fields from the launchpad documents."""
         if self.raw_data is None:
             logging.error("No launch data available for launch sites.")
             return
 
-        for launchpad_id in self.raw_data['launchpad']:
-            if launchpad_id:
-                url = self.LAUNCHPADS_URL + str(launchpad_id)
-                response = self.fetch_json(url)
-                if response:
-                    self.longitudes.append(response.get('longitude'))
-                    self.latitudes.append(response.get('latitude'))
-                    self.launch_sites.append(response.get('name'))
-                else:
-                    self.longitudes.append(None)
-                    self.latitudes.append(None)
-                    self.launch_sites.append(None)
-            else:
-                self.longitudes.append(None)
-                self.latitudes.append(None)
-                self.launch_sites.append(None)
+        for i, launchpad in enumerate(self.raw_data['launchpad']):
+            launchpad = launchpad or {}
+            self.longitudes[i] = launchpad.get('longitude')
+            self.latitudes[i] = launchpad.get('latitude')
+            self.launch_sites[i] = launchpad.get('name')
 
     def get_payload_data(self) -> None:
-        """Populate payload related fields from the API."""
+        """Populate payload related fields from the payload documents."""
         if self.raw_data is None:
             logging.error("No launch data available for payloads.")
             return
 
-        for payload_id in self.raw_data['payloads']:
-            if payload_id:
-                url = self.PAYLOADS_URL + str(payload_id)
-                response = self.fetch_json(url)
-                if response:
-                    self.payload_masses.append(response.get('mass_kg'))
-                    self.orbits.append(response.get('orbit'))
-                else:
-                    self.payload_masses.append(None)
-                    self.orbits.append(None)
-            else:
-                self.payload_masses.append(None)
-                self.orbits.append(None)
+        for i, payload in enumerate(self.raw_data['payloads']):
+            payload = payload or {}
+            self.payload_masses[i] = payload.get('mass_kg')
+            self.orbits[i] = payload.get('orbit')
 
     def get_booster_version_data(self) -> None:
-        """Populate booster version information using the rocket ID."""
+        """Populate booster version information from the rocket documents."""
         if self.raw_data is None:
             logging.error("No launch data available for booster versions.")
             return
 
-        for rocket_id in self.raw_data['rocket']:
-            if rocket_id:
-                url = self.ROCKETS_URL + str(rocket_id)
-                response = self.fetch_json(url)
-                if response:
-                    self.booster_versions.append(response.get('name'))
-                else:
-                    self.booster_versions.append(None)
-            else:
-                self.booster_versions.append(None)
+        for i, rocket in enumerate(self.raw_data['rocket']):
+            self.booster_versions[i] = (rocket or {}).get('name')
 
     def get_core_data(self) -> None:
-        """Populate core related fields from the API."""
+        """Populate core related fields from the launch cores."""
         if self.raw_data is None:
             logging.error("No launch data available for core information.")
             return
 
-        for core_info in self.raw_data['cores']:
-            core_id = core_info.get('core')
-            if core_id:
-                url = self.CORES_URL + str(core_id)
-                response = self.fetch_json(url)
-                if response:
-                    self.block_numbers.append(response.get('block'))
-                    self.reuse_counts.append(response.get('reuse_count'))
-                    self.core_serials.append(response.get('serial'))
-                else:
-                    self.block_numbers.append(None)
-                    self.reuse_counts.append(None)
-                    self.core_serials.append(None)
-            else:
-                self.block_numbers.append(None)
-                self.reuse_counts.append(None)
-                self.core_serials.append(None)
-
-            landing_success = core_info.get('landing_success')
-            landing_type = core_info.get('landing_type')
-            self.outcomes.append(f"{landing_success} {landing_type}")
-            self.flights.append(core_info.get('flight'))
-            self.grid_fins.append(core_info.get('gridfins'))
-            self.reused_status.append(core_info.get('reused'))
-            self.legs.append(core_info.get('legs'))
-            self.landing_pads.append(core_info.get('landpad'))
+        landing_success = np.full(len(self.raw_data), None, dtype=object)
+        landing_type = np.full(len(self.raw_data), None, dtype=object)
+        for i, core_info in enumerate(self.raw_data['cores']):
+            core = core_info.get('core') or {}
+            self.block_numbers[i] = core.get('block')
+            self.reuse_counts[i] = core.get('reuse_count')
+            self.core_serials[i] = core.get('serial')
+
+            landing_success[i] = core_info.get('landing_success')
+            landing_type[i] = core_info.get('landing_type')
+            self.flights[i] = core_info.get('flight')
+            self.grid_fins[i] = core_info.get('gridfins')
+            self.reused_status[i] = core_info.get('reused')
+            self.legs[i] = core_info.get('legs')
+            self.landing_pads[i] = core_info.get('landpad')
+
+        # Outcome is "<landing_success> <landing_type>", e.g. "True ASDS"
+        self.outcomes = (landing_success.astype(str).astype(object) + ' '
+                         + landing_type.astype(str).astype(object))
 
     def process_all_data(self) -> None:
         """
@@ -222,12 +282,10 @@ class SpaceXDataExtractor:
     def _create_dataframe(self) -> None:
         """
         Construct the final DataFrame from the collected data.
-
-        Rows with a booster version of 'Falcon 1' are filtered out.
         """
         launch_data = {
-            'FlightNumber': list(self.raw_data['flight_number']),
-            'Date': list(self.raw_data['date_utc']),
+            'FlightNumber': self.raw_data['flight_number'].to_numpy(),
+            'Date': self.raw_data['date_utc'].to_numpy(),
             'BoosterVersion': self.booster_versions,
             'PayloadMass': self.payload_masses,
             'Orbit': self.orbits,
@@ -244,8 +302,8 @@ class SpaceXDataExtractor:
             'Longitude': self.longitudes,
             'Latitude': self.latitudes
         }
-        df = pd.DataFrame(launch_data)
-        self.processed_data = df[df['BoosterVersion'] != 'Falcon 1']
+        # Infer column dtypes from the object arrays as pandas would from lists
+        self.processed_data = pd.DataFrame(launch_data).infer_objects()
 
     def export_to_csv(self, filename: str = "SpaceX_API_data.csv") -> None:
         """
@@ -260,12 +318,37 @@ class SpaceXDataExtractor:
         else:
             logging.error("No processed data available. Run process_all_data() first.")
 
+    def export_to_parquet(self, filename: str = "SpaceX_API_data.parquet") -> None:
+        """
+        Export the processed DataFrame to a zstd-compressed Parquet file.
+
+        Parquet keeps the column dtypes and is faster to write and read
+        than CSV, so it is the preferred input for downstream analysis.
+
+        Args:
+            filename (str): The name of the Parquet file.
+        """
+        if self.processed_data is None:
+            logging.error("No processed data available. Run process_all_data() first.")
+            return
+
+        try:
+            self.processed_data.to_parquet(filename, engine='pyarrow',
+                                           compression='zstd', index=False)
+            logging.info("Data exported to %s", filename)
+        except Exception as error:
+            logging.error("Error exporting data to Parquet: %s", error)
+
 
 def main() -> None:
     """Run the SpaceX data extraction and export process."""
     extractor = SpaceXDataExtractor()
-    extractor.process_all_data()
-    extractor.export_to_csv()
+    try:
+        extractor.process_all_data()
+        extractor.export_to_csv()
+        extractor.export_to_parquet()
+    finally:
+        extractor.close()
 
 
 if __name__ == "__main__":
@@ -1,9 +1,10 @@
 import logging
 from typing import Optional
 
+import lxml.html
 import pandas as pd
 import requests
-from bs4 import BeautifulSoup
+import requests_cache
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
@@ -19,6 +20,33 @@ class Falcon9Scraper:
     """
 
     URL: str = "https://en.wikipedia.org/wiki/List_of_Falcon_9_launches"
+    # Text nodes of a cell, excluding inline <style>/<script> contents
+    CELL_TEXT_XPATH: str = ".//text()[not(ancestor::style or ancestor::script)]"
+    TABLE_ROWS_XPATH: str = (
+        "(//table[contains(concat(' ', normalize-space(@class), ' '),"
+        " ' wikitable ')])[1]//tr"
+    )
+    CACHE_NAME: str = "wiki_cache"
+    CACHE_EXPIRE_SECONDS: int = 3600
+
+    def __init__(self) -> None:
+        """
+        Initialize the scraper with an HTTP session backed by a local cache.
+
+        Responses are stored in a SQLite cache and revalidated with the
+        server's ETag once expired, so an unchanged page is not downloaded
+        again.
+        """
+        self.session: requests_cache.CachedSession = requests_cache.CachedSession(
+            self.CACHE_NAME,
+            backend="sqlite",
+            expire_after=self.CACHE_EXPIRE_SECONDS,
+            cache_control=True
+        )
+
+    def close(self) -> None:
+        """Close the cached HTTP session."""
+        self.session.close()
 
     def get_html_content(self, url: str) -> Optional[str]:
         """
@@ -34,13 +62,32 @@ class Falcon9Scraper:
             HTTPError: If the HTTP request fails.
         """
         try:
-            response = requests.get(url)
+            response = self.session.get(url)
             response.raise_for_status()
+            if response.from_cache:
+                logging.info("Using cached HTML content for %s", url)
             return response.text
         except requests.RequestException as error:
             logging.error("Error fetching HTML content from %s: %s", url, error)
             return None
 
+    @staticmethod
+    def _cell_text(cell: lxml.html.HtmlElement) -> str:
+        """
+        Return the stripped text fragments of a table cell joined by spaces.
+
+        Text inside ``style`` and ``script`` elements is skipped, as
+        BeautifulSoup's ``get_text`` does.
+
+        Args:
+            cell (lxml.html.HtmlElement): A ``td`` or ``th`` element.
+
+        Returns:
+            str: The cell text.
+        """
+        texts = cell.xpath(Falcon9Scraper.CELL_TEXT_XPATH)
+        return " ".join(filter(None, map(str.strip, texts)))
+
     def parse_launch_table(self, html: str) -> pd.DataFrame:
         """
         Parse the HTML content to extract Falcon 9 launch data from the table.
@@ -51,35 +98,34 @@ class Falcon9Scraper:
         Returns:
             pd.DataFrame: DataFrame containing the parsed launch data.
         """
-        soup = BeautifulSoup(html, "html.parser")
-        table = soup.find("table", {"class": "wikitable"})
-        if table is None:
+        rows = lxml.html.fromstring(html).xpath(self.TABLE_ROWS_XPATH)
+        if not rows:
             logging.error("No table with class 'wikitable' found.")
             return pd.DataFrame()
 
         # Extract header names
-        headers = [
-            th.get_text(separator=" ", strip=True)
-            for th in table.find("tr").find_all("th")
-        ]
-
-        data_rows = []
-        for row in table.find_all("tr")[1:]:
-            cells = row.find_all(["td", "th"])
+        headers = [self._cell_text(th) for th in rows[0].xpath(".//th")]
+
+        columns = [[] for _ in headers]
+        for row in rows[1:]:
+            cells = row.xpath(".//td|.//th")
             if not cells:
                 continue
-            row_text = [cell.get_text(separator=" ", strip=True) for cell in cells]
+            row_text = [self._cell_text(cell) for cell in cells]
 
             # Skip rows that don't match header structure or contain too much text.
-            if len(row_text) < len(headers) or len(" ".join(row_text)) > 200:
+            # The text length is that of the cells joined by single spaces.
+            if (len(row_text) < len(headers)
+                    or sum(map(len, row_text)) + len(row_text) - 1 > 200):
                 continue
 
             if len(row_text) < len(headers):
                 row_text += [None] * (len(headers) - len(row_text))
 
-            data_rows.append(dict(zip(headers, row_text)))
+            for column, value in zip(columns, row_text):
+                column.append(value)
 
-        df = pd.DataFrame(data_rows)
+        df = pd.DataFrame(dict(zip(headers, columns)))
         return df
 
     def clean_launch_data(self, df: pd.DataFrame) -> pd.DataFrame:
@@ -153,7 +199,10 @@ class Falcon9Scraper:
 def main() -> None:
     """Main function to execute the Falcon 9 scraper."""
     scraper = Falcon9Scraper()
-    scraper.run()
+    try:
+        scraper.run()
+    finally:
+        scraper.close()
 
 
 if __name__ == "__main__":